@@ -0,0 +1,58 @@
+"""
+Compares dict/set workloads keyed by ints and by each kind of enum value.
+
+Usage:
+    python benchmarks/hashing.py
+"""
+import timeit
+
+from richenum import OrderedRichEnum
+from richenum import OrderedRichEnumValue
+from richenum import RichEnum
+from richenum import RichEnumValue
+from richenum import SingletonOrderedRichEnumValue
+from richenum import SingletonRichEnumValue
+
+
+SIZE = 50
+NUMBER = 2000
+
+
+def make_enum(enum_base, member_cls):
+    if issubclass(member_cls, OrderedRichEnumValue):
+        members = [member_cls(i, 'member_%s' % i, 'Member %s' % i) for i in range(SIZE)]
+    else:
+        members = [member_cls('member_%s' % i, 'Member %s' % i) for i in range(SIZE)]
+    attrs = dict(('MEMBER_%s' % i, member) for i, member in enumerate(members))
+    return type(enum_base)('Bench' + member_cls.__name__, (enum_base,), attrs)
+
+
+def workloads(keys):
+    keys = list(keys) * 20
+    table = dict((key, i) for i, key in enumerate(keys))
+    key_set = set(keys)
+    return [
+        ('dict build', lambda: dict((key, i) for i, key in enumerate(keys))),
+        ('dict lookup', lambda: [table[key] for key in keys]),
+        ('set build', lambda: set(keys)),
+        ('set membership', lambda: [key in key_set for key in keys]),
+    ]
+
+
+def main():
+    candidates = [
+        ('int', range(SIZE)),
+        ('RichEnumValue', make_enum(RichEnum, RichEnumValue).members()),
+        ('SingletonRichEnumValue', make_enum(RichEnum, SingletonRichEnumValue).members()),
+        ('OrderedRichEnumValue', make_enum(OrderedRichEnum, OrderedRichEnumValue).members()),
+        ('SingletonOrderedRichEnumValue', make_enum(OrderedRichEnum, SingletonOrderedRichEnumValue).members()),
+    ]
+    print('%-16s %-30s %10s' % ('workload', 'key type', 'usec/loop'))
+    for key_name, keys in candidates:
+        for workload_name, func in workloads(keys):
+            seconds = min(timeit.repeat(func, number=NUMBER, repeat=3))
+            print('%-16s %-30s %10.1f' % (workload_name, key_name, seconds / NUMBER * 1e6))
+
+
+if __name__ == '__main__':
+    main()
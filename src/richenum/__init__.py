@@ -1,3 +1,4 @@
+from .dynamic import DynamicRichEnum
 from .enums import enum
 from .enums import EnumConstructionException
 from .enums import EnumLookupError
@@ -5,6 +6,12 @@ from .enums import OrderedRichEnum
 from .enums import OrderedRichEnumValue
 from .enums import RichEnum
 from .enums import RichEnumValue
+from .enums import SingletonOrderedRichEnumValue
+from .enums import SingletonRichEnumValue
+from .interop import from_arrow
+from .interop import from_categorical
+from .interop import to_arrow
+from .interop import to_categorical
 
 
 __all__ = [
@@ -15,6 +22,13 @@ __all__ = [
     'OrderedRichEnum',
     'RichEnum',
     'EnumLookupError',
+    'DynamicRichEnum',
+    'SingletonRichEnumValue',
+    'SingletonOrderedRichEnumValue',
+    'to_arrow',
+    'from_arrow',
+    'to_categorical',
+    'from_categorical',
 ]
 
 
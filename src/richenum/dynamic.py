@@ -0,0 +1,236 @@
+import asyncio
+import collections.abc
+import logging
+import types
+
+from .enums import EnumConstructionException
+from .enums import OrderedRichEnum
+from .enums import OrderedRichEnumValue
+from .enums import RichEnum
+from .enums import RichEnumValue
+from .enums import _SingletonEnumValueMixin
+
+
+logger = logging.getLogger(__name__)
+
+
+def _build_index(members, field):
+    """
+    Maps each member's ``field`` value to the first member that has it, or
+    returns None if some value isn't hashable or is a non-string iterable.
+
+    RichEnum.lookup also matches values inside iterable fields, which a dict
+    can't answer in member order, so such fields are left to the linear scan.
+    """
+    index = {}
+    try:
+        for member in members:
+            value = getattr(member, field)
+            if not isinstance(value, str) and isinstance(value, collections.abc.Iterable):
+                return None
+            index.setdefault(value, member)
+    except TypeError:
+        return None
+    return types.MappingProxyType(index)
+
+
+class _SnapshotMethods(object):
+    """
+    Answers lookups on indexed fields from the prebuilt indexes, falling back
+    to the regular linear scan for other fields, fields that couldn't be
+    indexed, unhashable values and misses.
+    """
+    _INDEXES = {
+        'canonical_name': '_BY_CANONICAL',
+        'display_name': '_BY_DISPLAY',
+        'index': '_BY_INDEX',
+    }
+
+    @classmethod
+    def lookup(cls, field, value):
+        index_attr = cls._INDEXES.get(field)
+        index = getattr(cls, index_attr, None) if index_attr else None
+        if index is not None:
+            try:
+                return index[value]
+            except (KeyError, TypeError):
+                pass
+        return super(_SnapshotMethods, cls).lookup(field, value)  # pylint: disable=E1101
+
+
+def _build_snapshot(name, members):
+    """
+    Builds an immutable RichEnum (or OrderedRichEnum) class from an iterable of
+    enum values, with prebuilt indexes for O(1) lookups.
+
+    Members are set directly rather than as class attributes, so canonical
+    names don't have to be valid (or upper-cased) attribute names.
+    """
+    members = tuple(members)
+    if not members:
+        raise EnumConstructionException("Must load at least one member into %s" % name)
+
+    member_type = type(members[0])
+    seen = set()
+    for member in members:
+        if not isinstance(member, RichEnumValue):
+            raise EnumConstructionException("Invalid member: %r" % (member,))
+        if isinstance(member, _SingletonEnumValueMixin):
+            # Snapshots can't be imported by name, so singletons couldn't be
+            # pickled by reference and would lose their identity.
+            raise EnumConstructionException("Singleton members can't be loaded dynamically: %r" % (member,))
+        if type(member) is not member_type:
+            raise EnumConstructionException("Differing member types: have seen %s,"
+                                            " encountered %s" % (member_type, type(member)))
+        if member.canonical_name in seen:
+            raise EnumConstructionException("Canonical name already defined: %s." % (member.canonical_name,))
+        seen.add(member.canonical_name)
+
+    cls_attrs = {'__virtual__': True}
+    if issubclass(member_type, OrderedRichEnumValue):
+        base = OrderedRichEnum
+        # Sort before indexing, so the first match is the same as in a static enum.
+        members = tuple(sorted(members, key=lambda x: x.index))
+        by_index = _build_index(members, 'index')
+        if len(by_index) != len(members):
+            raise EnumConstructionException("Index already defined in %s." % name)
+        cls_attrs['_BY_INDEX'] = by_index
+    else:
+        base = RichEnum
+    cls_attrs['_BY_CANONICAL'] = _build_index(members, 'canonical_name')
+    cls_attrs['_BY_DISPLAY'] = _build_index(members, 'display_name')
+
+    snapshot = type(base)(name, (_SnapshotMethods, base), cls_attrs)
+    snapshot._MEMBERS = members
+    return snapshot
+
+
+class DynamicRichEnum(object):
+    """
+    A RichEnum whose members are produced by an async loader and refreshed in
+    the background.
+
+    Every load builds a brand new RichEnum (or OrderedRichEnum, if the loader
+    returns OrderedRichEnumValues) class and swaps it in with a single
+    assignment, so readers never observe a partially rebuilt enum. Callers
+    that need several consistent lookups should grab ``snapshot`` once and use
+    it throughout.
+
+    Usage:
+
+        >>> async def load_colors():
+        ...     rows = await db.fetch("SELECT name, label FROM colors")
+        ...     return [RichEnumValue(name, label) for name, label in rows]
+        ...
+        >>> Color = DynamicRichEnum("Color", load_colors, refresh_interval=300)
+        >>> await Color.refresh()
+        >>> Color.start()
+        >>> Color.from_canonical("red")
+        <RichEnumValue: red ('Red')>
+        >>> await Color.stop()
+
+    Notes:
+        1) Like any RichEnum, a snapshot needs at least one member: refresh()
+           raises EnumConstructionException if the loader returns no rows, and
+           so does an invalid member set (duplicate canonical names or indexes,
+           mixed member types, or singleton members, which couldn't be pickled
+           by reference).
+        2) If a background refresh fails for any reason, including an empty
+           load, the error is logged and the previous snapshot stays in place.
+        3) Members aren't exposed as attributes, since canonical names loaded
+           from a table needn't be identifiers. Use from_canonical() and
+           friends, which are answered from indexes rebuilt on every load.
+    """
+
+    def __init__(self, name, loader, refresh_interval=None):
+        self.name = name
+        self._loader = loader
+        self.refresh_interval = refresh_interval
+        self._snapshot = None
+        self._task = None
+        # Generation of the latest load started, and of the snapshot in place.
+        self._started = 0
+        self._applied = 0
+
+    def __repr__(self):
+        return "<%s: %s>" % (self.__class__.__name__, self.name)
+
+    @property
+    def snapshot(self):
+        if self._snapshot is None:
+            raise RuntimeError("%s has not been loaded yet; await refresh() first." % self.name)
+        return self._snapshot
+
+    @property
+    def running(self):
+        return self._task is not None and not self._task.done()
+
+    async def refresh(self):
+        """
+        Awaits the loader, builds a new snapshot and swaps it in. Returns the
+        new snapshot.
+
+        If loads overlap, a slow load never replaces the snapshot of one that
+        started after it; it returns the newer snapshot instead.
+        """
+        self._started += 1
+        generation = self._started
+        members = await self._loader()
+        snapshot = _build_snapshot(self.name, members)
+        if generation > self._applied:
+            self._snapshot = snapshot
+            self._applied = generation
+        return self._snapshot
+
+    def start(self):
+        """
+        Schedules the background refresh loop on the running event loop.
+        Raises RuntimeError if called outside of one.
+        """
+        if self.refresh_interval is None:
+            raise ValueError("refresh_interval must be set to refresh in the background")
+        if self.running:
+            return self._task
+        loop = asyncio.get_running_loop()
+        self._task = loop.create_task(self._refresh_forever())
+        return self._task
+
+    async def stop(self):
+        if self._task is None:
+            return
+        task, self._task = self._task, None
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    async def _refresh_forever(self):
+        while True:
+            await asyncio.sleep(self.refresh_interval)
+            try:
+                await self.refresh()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Failed to refresh %s; keeping previous snapshot", self.name)
+
+    ############################################################################
+    # Delegation to the current snapshot
+    ############################################################################
+
+    def __iter__(self):
+        return iter(self.snapshot)
+
+    def __len__(self):
+        return len(self.snapshot)
+
+    def __contains__(self, item):
+        return item in self.snapshot
+
+    def __getattr__(self, attr):
+        # Only reached for attributes not defined on DynamicRichEnum itself.
+        # OrderedRichEnum has every public attribute a snapshot can have.
+        if attr.startswith('_') or not hasattr(OrderedRichEnum, attr):
+            raise AttributeError(attr)
+        return getattr(self.snapshot, attr)
@@ -106,7 +106,10 @@ class RichEnumValue(object):
             return False
         if not isinstance(other, type(self)):
             return False
-        return self.canonical_name == other.canonical_name
+        # Singletons hash by identity, so they can't equal anything else. Only
+        # checked on a name match to keep the common path cheap.
+        return (self.canonical_name == other.canonical_name and
+                not isinstance(other, _SingletonEnumValueMixin))
 
     def __ne__(self, other):
         return not (self.__eq__(other))
@@ -148,7 +151,7 @@ class OrderedRichEnumValue(RichEnumValue):
 
     def __eq__(self, other):
         if isinstance(other, type(self)):
-            return self.index == other.index
+            return self.index == other.index and not isinstance(other, _SingletonEnumValueMixin)
         else:
             return False
 
@@ -160,6 +163,53 @@ class OrderedRichEnumValue(RichEnumValue):
         return hash(self.canonical_name + str(self.index))
 
 
+class _SingletonEnumValueMixin(object):
+    """
+    Makes enum values compare and hash by identity, using object's C-level
+    __eq__ and __hash__ instead of the Python ones on RichEnumValue.
+
+    Each member records the enum and attribute it was declared on, which is
+    checked when enums are built (see _claim_singletons) and used to pickle
+    the member by reference.
+    """
+    __eq__ = object.__eq__
+    __ne__ = object.__ne__
+    __hash__ = object.__hash__
+
+    _enum_cls = None
+    _enum_attr = None
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce_ex__(self, protocol):
+        if self._enum_cls is None:
+            return super(_SingletonEnumValueMixin, self).__reduce_ex__(protocol)
+        return (getattr, (self._enum_cls, self._enum_attr))
+
+
+class SingletonRichEnumValue(_SingletonEnumValueMixin, RichEnumValue):
+    """
+    RichEnumValue that compares and hashes by identity, so it can be used as a
+    dict/set key at the speed of a plain object.
+
+    A singleton member can only be declared on one enum, and canonical names
+    must be unique within that enum. Since equality is identity, it's only
+    equal to itself, never to a separately constructed value.
+    """
+    pass
+
+
+class SingletonOrderedRichEnumValue(_SingletonEnumValueMixin, OrderedRichEnumValue):
+    """
+    OrderedRichEnumValue counterpart of SingletonRichEnumValue.
+    """
+    pass
+
+
 def _setup_members(cls_attrs, cls_parents, member_cls):
     members = []
 
@@ -196,7 +246,36 @@ def _setup_members(cls_attrs, cls_parents, member_cls):
     return members
 
 
+def _claim_singletons(enum_cls, cls_attrs):
+    """
+    Records the owning enum and attribute on each singleton member, making
+    sure no member is shared between enums and canonical names are unique.
+    """
+    claims = {}
+    for attr_key, attr_value in cls_attrs.items():
+        if attr_key.startswith("_") or not attr_key.isupper():
+            continue
+        if not isinstance(attr_value, _SingletonEnumValueMixin):
+            continue
+
+        if attr_value._enum_cls is not None:
+            raise EnumConstructionException("Singleton member %r already belongs to %s.%s"
+                                            % (attr_value, attr_value._enum_cls.__name__, attr_value._enum_attr))
+        if attr_value.canonical_name in claims:
+            raise EnumConstructionException("Canonical name already defined: %s." % (attr_value.canonical_name,))
+        claims[attr_value.canonical_name] = attr_key
+
+    for attr_key in claims.values():
+        member = cls_attrs[attr_key]
+        member._enum_cls = enum_cls
+        member._enum_attr = attr_key
+
+
 class _BaseRichEnumMetaclass(type):
+    def __init__(cls, cls_name, cls_parents, cls_attrs):
+        super(_BaseRichEnumMetaclass, cls).__init__(cls_name, cls_parents, cls_attrs)
+        _claim_singletons(cls, cls_attrs)
+
     def __iter__(cls):
         for item in cls.members():
             yield item
@@ -0,0 +1,153 @@
+"""
+Converters between sequences of enum members and columnar formats.
+
+pyarrow and pandas are optional: they're imported when a converter is called,
+so install whichever one you need alongside richenum (the ``arrow`` and
+``pandas`` extras). Both converters also need numpy, which pandas depends on
+and the ``arrow`` extra installs.
+"""
+from weakref import WeakKeyDictionary
+
+from .dynamic import DynamicRichEnum
+from .enums import OrderedRichEnum
+
+
+class _IndexTables(object):
+    """
+    Precomputed lookup tables for one enum class. Codes are positions in
+    members() order, and -1 stands for a missing value (None).
+    """
+    def __init__(self, enum_cls):
+        import numpy as np
+
+        members = enum_cls.members()
+        self.names = [member.canonical_name for member in members]
+        self.ordered = issubclass(enum_cls, OrderedRichEnum)
+        # Keyed by identity: members of another enum never match, even if they
+        # compare equal, and encoding doesn't call RichEnumValue.__hash__.
+        # member_table keeps the members (and so their ids) alive.
+        self.code_by_id = dict((id(member), code) for code, member in enumerate(members))
+        self.code_by_id[id(None)] = -1
+        self.code_by_name = dict((name, code) for code, name in enumerate(self.names))
+
+        # Trailing None so that code -1 maps back to a missing value.
+        self.member_table = np.empty(len(members) + 1, dtype=object)
+        self.member_table[:-1] = members
+        self.member_table[-1] = None
+
+
+_TABLES = WeakKeyDictionary()
+
+
+def _resolve(enum_cls):
+    if isinstance(enum_cls, DynamicRichEnum):
+        enum_cls = enum_cls.snapshot
+    try:
+        tables = _TABLES[enum_cls]
+    except KeyError:
+        tables = _TABLES[enum_cls] = _IndexTables(enum_cls)
+    return enum_cls, tables
+
+
+def _encode(enum_cls, tables, values):
+    import numpy as np
+
+    code_by_id = tables.code_by_id
+
+    def codes():
+        for value in values:
+            try:
+                yield code_by_id[id(value)]
+            except KeyError:
+                raise enum_cls.LookupError('Could not find member %r in enum %s' % (value, enum_cls))
+
+    return np.fromiter(codes(), dtype=np.int32)
+
+
+def _decode(enum_cls, tables, codes, dictionary):
+    """
+    Maps codes into ``dictionary`` (a list of canonical names) back to members.
+    """
+    import numpy as np
+
+    if list(dictionary) != tables.names:
+        remap = np.empty(len(dictionary) + 1, dtype=np.int64)
+        for position, name in enumerate(dictionary):
+            try:
+                remap[position] = tables.code_by_name[name]
+            except KeyError:
+                raise enum_cls.LookupError('Could not find member matching canonical_name = %s in enum %s'
+                                           % (name, enum_cls))
+        remap[-1] = -1
+        codes = remap[codes]
+    return tables.member_table[codes].tolist()
+
+
+def to_arrow(enum_cls, values):
+    """
+    Converts a sequence of members of ``enum_cls`` (or None) to a
+    pyarrow.DictionaryArray whose dictionary is the enum's canonical names in
+    member order. None becomes null.
+
+    Values are matched by identity, so copies of members (or equal members of
+    another enum) raise the enum's LookupError.
+    """
+    import pyarrow as pa
+
+    enum_cls, tables = _resolve(enum_cls)
+    codes = _encode(enum_cls, tables, values)
+    return pa.DictionaryArray.from_arrays(
+        pa.array(codes, mask=codes < 0),
+        pa.array(tables.names, type=pa.string()),
+        ordered=tables.ordered,
+    )
+
+
+def from_arrow(enum_cls, array):
+    """
+    Converts a dictionary-encoded pyarrow array (or chunked array) of canonical
+    names back to a list of members of ``enum_cls``. Nulls become None.
+    """
+    import pyarrow as pa
+
+    enum_cls, tables = _resolve(enum_cls)
+    if isinstance(array, pa.ChunkedArray):
+        return [member for chunk in array.chunks for member in from_arrow(enum_cls, chunk)]
+    if not isinstance(array, pa.Array) or not pa.types.is_dictionary(array.type):
+        raise TypeError('Expected a dictionary-encoded pyarrow array, not: %s'
+                        % getattr(array, 'type', type(array)))
+    # Cast first: unsigned indices can't hold the -1 used for nulls.
+    codes = array.indices.cast(pa.int64()).fill_null(-1).to_numpy(zero_copy_only=False)
+    return _decode(enum_cls, tables, codes, array.dictionary.to_pylist())
+
+
+def to_categorical(enum_cls, values):
+    """
+    Converts a sequence of members of ``enum_cls`` (or None) to a
+    pandas.Categorical whose categories are the enum's canonical names in
+    member order. None becomes NaN.
+
+    Values are matched by identity, so copies of members (or equal members of
+    another enum) raise the enum's LookupError.
+    """
+    import pandas as pd
+
+    enum_cls, tables = _resolve(enum_cls)
+    codes = _encode(enum_cls, tables, values)
+    return pd.Categorical.from_codes(codes, categories=tables.names, ordered=tables.ordered)
+
+
+def from_categorical(enum_cls, categorical):
+    """
+    Converts a pandas.Categorical (or a Series with categorical dtype) of
+    canonical names back to a list of members of ``enum_cls``. NaN becomes None.
+    """
+    import pandas as pd
+
+    enum_cls, tables = _resolve(enum_cls)
+    if not isinstance(getattr(categorical, 'dtype', None), pd.CategoricalDtype):
+        raise TypeError('Expected a pandas.Categorical or categorical Series, not: %s'
+                        % getattr(categorical, 'dtype', type(categorical)))
+    if isinstance(categorical, pd.Series):
+        categorical = categorical.array
+    return _decode(enum_cls, tables, categorical.codes, categorical.categories)
@@ -0,0 +1,215 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=E1101
+
+import asyncio
+import unittest
+
+from richenum import DynamicRichEnum  # noqa
+from richenum import EnumConstructionException  # noqa
+from richenum import EnumLookupError  # noqa
+from richenum import OrderedRichEnum  # noqa
+from richenum import OrderedRichEnumValue  # noqa
+from richenum import RichEnum  # noqa
+from richenum import RichEnumValue  # noqa
+from richenum import SingletonRichEnumValue  # noqa
+
+
+class InMemoryLoader(object):
+    """
+    Stand-in for a database-backed loader: returns whatever rows it currently holds.
+    """
+    def __init__(self, rows, member_cls=RichEnumValue):
+        self.rows = rows
+        self.member_cls = member_cls
+        self.calls = 0
+        self.error = None
+
+    async def __call__(self):
+        self.calls += 1
+        if self.error is not None:
+            raise self.error
+        return [self.member_cls(*row) for row in self.rows]
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+class DynamicRichEnumTestSuite(unittest.TestCase):
+
+    def setUp(self):
+        self.loader = InMemoryLoader([('red', 'Red'), ('blue', 'Blue')])
+        self.colors = DynamicRichEnum('Color', self.loader, refresh_interval=0.01)
+
+    def test_snapshot_requires_load(self):
+        with self.assertRaises(RuntimeError):
+            self.colors.snapshot
+
+    def test_refresh_builds_rich_enum(self):
+        snapshot = run(self.colors.refresh())
+        self.assertIs(self.colors.snapshot, snapshot)
+        self.assertEqual(len(self.colors), 2)
+        self.assertEqual(self.colors.from_canonical('blue'), RichEnumValue('blue', 'Blue'))
+        self.assertEqual(self.colors.from_display('Red'), RichEnumValue('red', 'Red'))
+        self.assertIn(self.colors.from_canonical('blue'), self.colors)
+        self.assertEqual(set(self.colors), set(snapshot))
+
+    def test_lookups_use_indexes(self):
+        snapshot = run(self.colors.refresh())
+        self.assertEqual(dict(snapshot._BY_CANONICAL), dict((m.canonical_name, m) for m in snapshot))
+        self.assertEqual(dict(snapshot._BY_DISPLAY), dict((m.display_name, m) for m in snapshot))
+        self.assertIs(self.colors.lookup('display_name', 'Blue'), snapshot._BY_DISPLAY['Blue'])
+
+    def test_canonical_names_need_not_be_attribute_names(self):
+        self.loader.rows = [('_hidden', 'Hidden'), (7, 'Seven'), ('red', 'Red')]
+        run(self.colors.refresh())
+        self.assertEqual(len(self.colors), 3)
+        self.assertEqual([m.canonical_name for m in self.colors], ['_hidden', 7, 'red'])
+        self.assertIn(self.colors.from_canonical('_hidden'), self.colors)
+        self.assertEqual(self.colors.from_canonical(7).display_name, 'Seven')
+
+    def test_lookup_errors(self):
+        run(self.colors.refresh())
+        with self.assertRaises(EnumLookupError):
+            self.colors.from_canonical('green')
+        with self.assertRaises(self.colors.snapshot.LookupError):
+            self.colors.from_canonical(['unhashable'])
+
+    def test_refresh_swaps_snapshot(self):
+        old = run(self.colors.refresh())
+        self.loader.rows = [('green', 'Green')]
+        new = run(self.colors.refresh())
+
+        self.assertIsNot(old, new)
+        self.assertIs(self.colors.snapshot, new)
+        self.assertEqual(self.colors.from_canonical('green').display_name, 'Green')
+        # Readers holding the old snapshot still see a consistent enum.
+        self.assertEqual(len(old), 2)
+        self.assertEqual(old.from_canonical('red').display_name, 'Red')
+
+    def test_ordered_members_build_ordered_enum(self):
+        loader = InMemoryLoader([(1, 'oatmeal', 'Oatmeal'), (0, 'coffee', 'Coffee')], OrderedRichEnumValue)
+        breakfast = DynamicRichEnum('Breakfast', loader)
+        run(breakfast.refresh())
+        self.assertEqual([m.canonical_name for m in breakfast], ['coffee', 'oatmeal'])
+        self.assertEqual(breakfast.from_index(1).canonical_name, 'oatmeal')
+        self.assertEqual(sorted(breakfast.snapshot._BY_INDEX), [0, 1])
+
+        loader.rows = [(0, 'coffee', 'Coffee'), (0, 'tea', 'Tea')]
+        with self.assertRaises(EnumConstructionException):
+            run(breakfast.refresh())
+
+    def test_duplicate_display_names_match_static_enum(self):
+        class Letters(OrderedRichEnum):
+            B = OrderedRichEnumValue(1, 'b', 'Same')
+            A = OrderedRichEnumValue(0, 'a', 'Same')
+
+        loader = InMemoryLoader([(1, 'b', 'Same'), (0, 'a', 'Same')], OrderedRichEnumValue)
+        letters = DynamicRichEnum('Letters', loader)
+        run(letters.refresh())
+        self.assertEqual(Letters.from_display('Same').canonical_name, 'a')
+        self.assertEqual(letters.from_display('Same').canonical_name, 'a')
+
+    def test_iterable_fields_match_static_enum(self):
+        class Aliases(RichEnum):
+            A = RichEnumValue('a', ('x', 'y'))
+            B = RichEnumValue('b', 'x')
+
+        loader = InMemoryLoader([('a', ('x', 'y')), ('b', 'x')])
+        aliases = DynamicRichEnum('Aliases', loader)
+        snapshot = run(aliases.refresh())
+        self.assertIsNone(snapshot._BY_DISPLAY)
+        self.assertEqual(Aliases.from_display('x').canonical_name, 'a')
+        self.assertEqual(aliases.from_display('x').canonical_name, 'a')
+
+    def test_invalid_member_sets_are_rejected(self):
+        self.loader.rows = [('red', 'Red'), ('red', 'Rouge')]
+        with self.assertRaises(EnumConstructionException):
+            run(self.colors.refresh())
+
+        self.loader.rows = []
+        with self.assertRaises(EnumConstructionException):
+            run(self.colors.refresh())
+
+    def test_singleton_members_are_rejected(self):
+        loader = InMemoryLoader([('red', 'Red')], SingletonRichEnumValue)
+        colors = DynamicRichEnum('Color', loader)
+        with self.assertRaises(EnumConstructionException):
+            run(colors.refresh())
+
+    def test_start_requires_interval(self):
+        colors = DynamicRichEnum('Color', self.loader)
+        with self.assertRaises(ValueError):
+            colors.start()
+
+    def test_start_requires_running_loop(self):
+        with self.assertRaises(RuntimeError):
+            self.colors.start()
+        self.assertFalse(self.colors.running)
+
+    def test_stale_refresh_does_not_overwrite_newer_snapshot(self):
+        class SlowOldLoader(InMemoryLoader):
+            async def __call__(self):
+                rows = list(self.rows)
+                if rows == [('old', 'Old')]:
+                    await asyncio.sleep(0.05)
+                return [self.member_cls(*row) for row in rows]
+
+        loader = SlowOldLoader([])
+        colors = DynamicRichEnum('Color', loader)
+
+        async def scenario():
+            loader.rows = [('old', 'Old')]
+            slow = asyncio.ensure_future(colors.refresh())
+            await asyncio.sleep(0)
+            loader.rows = [('new', 'New')]
+            return await asyncio.gather(slow, colors.refresh())
+
+        # Overlapping refreshes must keep working on later event loops too.
+        for _ in range(2):
+            stale, fresh = run(scenario())
+            self.assertIs(stale, fresh)
+            self.assertIs(colors.snapshot, fresh)
+            self.assertEqual([m.canonical_name for m in colors], ['new'])
+
+    def test_attribute_access_before_load(self):
+        self.assertFalse(hasattr(self.colors, 'no_such_attribute'))
+        with self.assertRaises(AttributeError):
+            self.colors.no_such_attribute
+        with self.assertRaises(RuntimeError):
+            self.colors.from_canonical
+
+    def test_background_refresh(self):
+        async def scenario():
+            await self.colors.refresh()
+            self.colors.start()
+            self.assertTrue(self.colors.running)
+
+            self.loader.rows = [('green', 'Green')]
+            for _ in range(100):
+                await asyncio.sleep(0.01)
+                if 'green' in [m.canonical_name for m in self.colors]:
+                    break
+            await self.colors.stop()
+
+        run(scenario())
+        self.assertFalse(self.colors.running)
+        self.assertEqual(self.colors.from_canonical('green').display_name, 'Green')
+
+    def test_failed_background_refresh_keeps_snapshot(self):
+        async def scenario():
+            snapshot = await self.colors.refresh()
+            self.loader.error = RuntimeError('database is down')
+            calls = self.loader.calls
+            self.colors.start()
+            for _ in range(100):
+                await asyncio.sleep(0.01)
+                if self.loader.calls > calls + 1:
+                    break
+            self.assertTrue(self.colors.running)
+            await self.colors.stop()
+            return snapshot
+
+        with self.assertLogs('richenum.dynamic', level='ERROR'):
+            snapshot = run(scenario())
+        self.assertIs(self.colors.snapshot, snapshot)
@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=E1101
+
+import unittest
+import pytest
+
+from richenum import EnumLookupError  # noqa
+from richenum import from_arrow  # noqa
+from richenum import from_categorical  # noqa
+from richenum import OrderedRichEnum  # noqa
+from richenum import OrderedRichEnumValue  # noqa
+from richenum import RichEnum  # noqa
+from richenum import RichEnumValue  # noqa
+from richenum import to_arrow  # noqa
+from richenum import to_categorical  # noqa
+
+
+class Fruit(RichEnum):
+    APPLE = RichEnumValue('apple', 'Apple')
+    BANANA = RichEnumValue('banana', 'Banana')
+    CHERRY = RichEnumValue('cherry', 'Cherry')
+
+
+class Size(OrderedRichEnum):
+    LARGE = OrderedRichEnumValue(2, 'large', 'Large')
+    SMALL = OrderedRichEnumValue(0, 'small', 'Small')
+    MEDIUM = OrderedRichEnumValue(1, 'medium', 'Medium')
+
+
+class ArrowInteropTestSuite(unittest.TestCase):
+
+    def setUp(self):
+        self.pa = pytest.importorskip('pyarrow')
+
+    def test_dictionary_is_canonical_names_in_member_order(self):
+        array = to_arrow(Size, [Size.LARGE, Size.SMALL, Size.LARGE])
+        self.assertEqual(array.dictionary.to_pylist(), ['small', 'medium', 'large'])
+        self.assertEqual(array.indices.to_pylist(), [2, 0, 2])
+        self.assertTrue(array.type.ordered)
+        self.assertFalse(to_arrow(Fruit, [Fruit.APPLE]).type.ordered)
+
+    def test_round_trip_with_nulls(self):
+        values = [Fruit.CHERRY, None, Fruit.APPLE, Fruit.CHERRY]
+        array = to_arrow(Fruit, values)
+        self.assertEqual(array.null_count, 1)
+        self.assertEqual(from_arrow(Fruit, array), values)
+        self.assertIs(from_arrow(Fruit, array)[0], Fruit.CHERRY)
+
+    def test_from_arrow_remaps_foreign_dictionary(self):
+        array = self.pa.array(['cherry', 'apple', None, 'cherry']).dictionary_encode()
+        self.assertEqual(from_arrow(Fruit, array), [Fruit.CHERRY, Fruit.APPLE, None, Fruit.CHERRY])
+        chunked = self.pa.chunked_array([array, array])
+        self.assertEqual(len(from_arrow(Fruit, chunked)), 8)
+
+    def test_unknown_values_raise_lookup_error(self):
+        with self.assertRaises(Fruit.LookupError):
+            to_arrow(Fruit, [Fruit.APPLE, Size.SMALL])
+        with self.assertRaises(EnumLookupError):
+            from_arrow(Fruit, self.pa.array(['durian']).dictionary_encode())
+        with self.assertRaises(Fruit.LookupError):
+            to_arrow(Fruit, [Fruit.APPLE, ['unhashable']])
+
+    def test_members_of_other_enums_are_rejected(self):
+        class Produce(RichEnum):
+            APPLE = RichEnumValue('apple', 'Apple')
+
+        # Equal to Fruit.APPLE, but not a member of Fruit.
+        self.assertEqual(Produce.APPLE, Fruit.APPLE)
+        with self.assertRaises(Fruit.LookupError):
+            to_arrow(Fruit, [Produce.APPLE])
+
+    def test_unsigned_indices(self):
+        array = self.pa.DictionaryArray.from_arrays(
+            self.pa.array([1, None, 0], type=self.pa.uint8()),
+            self.pa.array(['banana', 'cherry']),
+        )
+        self.assertEqual(from_arrow(Fruit, array), [Fruit.CHERRY, None, Fruit.BANANA])
+
+    def test_requires_dictionary_array(self):
+        with self.assertRaises(TypeError):
+            from_arrow(Fruit, self.pa.array(['apple']))
+        with self.assertRaises(TypeError):
+            from_arrow(Fruit, ['apple'])
+
+
+class PandasInteropTestSuite(unittest.TestCase):
+
+    def setUp(self):
+        self.pd = pytest.importorskip('pandas')
+
+    def test_categories_are_canonical_names_in_member_order(self):
+        categorical = to_categorical(Size, [Size.MEDIUM, Size.SMALL])
+        self.assertEqual(list(categorical.categories), ['small', 'medium', 'large'])
+        self.assertEqual(list(categorical.codes), [1, 0])
+        self.assertTrue(categorical.ordered)
+
+    def test_round_trip_with_nulls(self):
+        values = [Fruit.BANANA, None, Fruit.APPLE]
+        categorical = to_categorical(Fruit, values)
+        self.assertEqual(list(categorical.codes), [1, -1, 0])
+        self.assertEqual(from_categorical(Fruit, categorical), values)
+        self.assertEqual(from_categorical(Fruit, self.pd.Series(categorical)), values)
+
+    def test_from_categorical_remaps_foreign_categories(self):
+        categorical = self.pd.Categorical(['cherry', 'banana', None])
+        self.assertEqual(from_categorical(Fruit, categorical), [Fruit.CHERRY, Fruit.BANANA, None])
+
+    def test_unknown_values_raise_lookup_error(self):
+        with self.assertRaises(Fruit.LookupError):
+            to_categorical(Fruit, [RichEnumValue('durian', 'Durian')])
+        with self.assertRaises(EnumLookupError):
+            from_categorical(Fruit, self.pd.Categorical(['durian']))
+        with self.assertRaises(Fruit.LookupError):
+            to_categorical(Fruit, [RichEnumValue('apple', 'Apple')])
+
+    def test_requires_categorical(self):
+        with self.assertRaises(TypeError):
+            from_categorical(Fruit, self.pd.Series(['apple']))
+        with self.assertRaises(TypeError):
+            from_categorical(Fruit, ['apple'])
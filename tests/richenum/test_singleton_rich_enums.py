@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=E1101
+
+import copy
+import os
+import pickle
+import subprocess
+import sys
+import unittest
+import pytest
+
+from richenum import EnumConstructionException  # noqa
+from richenum import OrderedRichEnum  # noqa
+from richenum import OrderedRichEnumValue  # noqa
+from richenum import RichEnum  # noqa
+from richenum import RichEnumValue  # noqa
+from richenum import SingletonOrderedRichEnumValue  # noqa
+from richenum import SingletonRichEnumValue  # noqa
+
+
+class PlanetEnumValue(SingletonRichEnumValue):
+    def __init__(self, moons, *args):  # pylint: disable=E1002
+        super(PlanetEnumValue, self).__init__(*args)
+        self.moons = moons
+
+
+class Planet(RichEnum):
+    EARTH = PlanetEnumValue(1, 'earth', 'Earth')
+    MARS = PlanetEnumValue(2, 'mars', 'Mars')
+
+
+class DistanceEnumValue(SingletonOrderedRichEnumValue):
+    pass
+
+
+class Distance(OrderedRichEnum):
+    FAR = DistanceEnumValue(1, 'far', 'Far')
+    NEAR = DistanceEnumValue(0, 'near', 'Near')
+
+
+class SingletonRichEnumTestSuite(unittest.TestCase):
+
+    def test_hash_and_equality_are_identity(self):
+        self.assertEqual(hash(Planet.EARTH), object.__hash__(Planet.EARTH))
+        self.assertIs(PlanetEnumValue.__eq__, object.__eq__)
+        self.assertIs(PlanetEnumValue.__hash__, object.__hash__)
+        self.assertEqual(Planet.EARTH, Planet.EARTH)
+        self.assertNotEqual(Planet.EARTH, Planet.MARS)
+        self.assertNotEqual(Planet.EARTH, 'earth')
+
+    def test_not_equal_to_plain_values(self):
+        # Comparing from either side must agree with the differing hashes.
+        plain_earth = RichEnumValue('earth', 'Earth')
+        self.assertNotEqual(Planet.EARTH, plain_earth)
+        self.assertNotEqual(plain_earth, Planet.EARTH)
+        self.assertFalse(plain_earth == Planet.EARTH)
+        self.assertNotEqual(OrderedRichEnumValue(0, 'near', 'Near'), Distance.NEAR)
+
+    def test_usable_as_keys(self):
+        moons = {Planet.EARTH: 1, Planet.MARS: 2}
+        self.assertEqual(moons[Planet.MARS], 2)
+        self.assertEqual(set(Planet), set((Planet.EARTH, Planet.MARS)))
+        self.assertIn(Planet.EARTH, Planet)
+
+    def test_enum_behaviour_is_unchanged(self):
+        self.assertIs(Planet.from_canonical('mars'), Planet.MARS)
+        self.assertIs(Planet.lookup('moons', 1), Planet.EARTH)
+        self.assertLess(Planet.EARTH, Planet.MARS)
+        self.assertEqual([m.canonical_name for m in Distance], ['near', 'far'])
+        self.assertIs(Distance.from_index(1), Distance.FAR)
+        self.assertLess(Distance.NEAR, Distance.FAR)
+
+    def test_duplicate_canonical_names_are_rejected(self):
+        with pytest.raises(EnumConstructionException, match=r"Canonical name already defined"):
+            class Twins(RichEnum):
+                ONE = SingletonRichEnumValue('twin', 'Twin')
+                TWO = SingletonRichEnumValue('twin', 'Twin')
+
+        with pytest.raises(EnumConstructionException, match=r"Canonical name already defined"):
+            class Alias(RichEnum):
+                EARTH = PlanetEnumValue(1, 'earth', 'Earth')
+                TERRA = EARTH
+
+    def test_members_cannot_be_shared_between_enums(self):
+        with pytest.raises(EnumConstructionException, match=r"already belongs to Planet.EARTH"):
+            class Home(RichEnum):
+                EARTH = Planet.EARTH
+
+    def test_same_name_in_other_enum_is_allowed(self):
+        class Defaults(RichEnum):
+            DEFAULT = SingletonRichEnumValue('default', 'Default')
+
+        class OtherDefaults(RichEnum):
+            DEFAULT = SingletonRichEnumValue('default', 'Default')
+
+        self.assertIsNot(Defaults.DEFAULT, OtherDefaults.DEFAULT)
+        self.assertIs(OtherDefaults.from_canonical('default'), OtherDefaults.DEFAULT)
+
+    def test_copy_and_pickle_return_the_singleton(self):
+        self.assertIs(copy.copy(Planet.EARTH), Planet.EARTH)
+        self.assertIs(copy.deepcopy(Planet.EARTH), Planet.EARTH)
+        self.assertIs(pickle.loads(pickle.dumps(Planet.MARS)), Planet.MARS)
+        self.assertIs(pickle.loads(pickle.dumps(Distance.NEAR)), Distance.NEAR)
+
+    def test_unpickle_in_fresh_process(self):
+        # pickle has to import the defining module to find the member.
+        script = (
+            "import pickle, sys\n"
+            "member = pickle.loads(sys.stdin.buffer.read())\n"
+            "enum_cls = sys.modules[type(member).__module__].Planet\n"
+            "print(member is enum_cls.MARS, member.canonical_name)\n"
+        )
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(path for path in sys.path if path))
+        output = subprocess.check_output(
+            [sys.executable, '-c', script], input=pickle.dumps(Planet.MARS), env=env,
+        )
+        self.assertEqual(output.decode().split(), ['True', 'mars'])